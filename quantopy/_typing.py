@@ -11,4 +11,4 @@ PythonScalar = Union[int, float]
 # `def func(a: FrameOrSeriesUnion) -> FrameOrSeriesUnion: ...` means that if a Series
 # is passed in, either a Series or DataFrame is returned, and if a DataFrame is passed
 # in, either a DataFrame or a Series is returned.
-FrameOrSeries = Union["DataFrame", "Series"]
+FrameOrSeries = Union[DataFrame, Series]
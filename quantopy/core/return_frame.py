@@ -1,17 +1,13 @@
-from typing import TYPE_CHECKING
-
 import numpy as np
 import pandas as pd
-import scipy.stats
 
+from quantopy.core.return_series import ReturnSeries
 from quantopy.stats import (
+    _utils,
     financial,
     stats,
 )
 
-if TYPE_CHECKING:
-    from quantopy.core.return_series import ReturnSeries
-
 
 class ReturnDataFrame(pd.DataFrame):
     @property
@@ -24,8 +20,6 @@ class ReturnDataFrame(pd.DataFrame):
         Used when a ReturnDataFrame (sub-)class manipulation result should be a ReturnSeries
         (sub-)class.
         """
-        from quantopy.core.return_series import ReturnSeries
-
         return ReturnSeries
 
     @classmethod
@@ -76,8 +70,9 @@ class ReturnDataFrame(pd.DataFrame):
         1  0.500000 -0.333333
         2  0.333333  0.750000
         """
+        # Prices are only read, so array-like input does not need to be copied
         return financial.get_simple_returns_from_price(
-            ReturnDataFrame(price, dtype="float64")
+            ReturnDataFrame(price, dtype="float64", copy=False)
         )
 
     def cumulated(self) -> "ReturnDataFrame":
@@ -126,7 +121,11 @@ class ReturnDataFrame(pd.DataFrame):
         stock_2    0.208334
         dtype: float64
         """
-        return super().mean()
+        values = _utils.dense_values(self)
+        if values is None:
+            return super().mean()
+
+        return _utils.wrap_reduction(self, _utils.mean(values))
 
     def gmean(self) -> "ReturnSeries":
         """
@@ -254,6 +253,20 @@ class ReturnDataFrame(pd.DataFrame):
         """
         return financial.drawdown(self)
 
+    def max_drawdown(self) -> "ReturnSeries":
+        """Compute the largest drawdown in series of simple returns, i.e. the worst peak to
+        trough decline.
+
+        Returns
+        -------
+        out : qp.ReturnSeries
+
+        References
+        ----------
+        .. [1] "Drawdown", *Wikipedia*, https://en.wikipedia.org/wiki/Drawdown_(economics).
+        """
+        return financial.max_drawdown(self)
+
     def effect_vol(
         self,
         period: stats.period = stats.period.MONTHLY,
@@ -283,14 +296,20 @@ class ReturnDataFrame(pd.DataFrame):
         """
         return stats.total_return(self)
 
-    def log(self):
-        return (self + 1).apply(np.log)  # type: ignore
+    def log(self) -> "ReturnDataFrame":
+        return np.log1p(self)
 
-    def skew(self):
-        return self.aggregate(scipy.stats.skew)
+    def skew(self) -> "ReturnSeries":
+        skew, _ = _utils.skew_kurtosis(self)
+        return _utils.wrap_reduction(self, skew)
 
-    def kurtosis(self):
-        return self.aggregate(scipy.stats.kurtosis) + 3
+    def kurtosis(self) -> "ReturnSeries":
+        _, kurtosis = _utils.skew_kurtosis(self)
+        return _utils.wrap_reduction(self, kurtosis)
 
     def is_normal(self, pvalue=0.01):
-        return self.aggregate(scipy.stats.jarque_bera).iloc[1] > pvalue
+        # Jarque-Bera test: the statistic follows a chi-squared distribution with two
+        # degrees of freedom, whose survival function is exp(-x / 2).
+        skew, kurtosis = _utils.skew_kurtosis(self)
+        jb_value = len(self) / 6 * (skew ** 2 + (kurtosis - 3) ** 2 / 4)
+        return _utils.wrap_reduction(self, np.exp(-jb_value / 2) > pvalue)
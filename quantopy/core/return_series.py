@@ -1,17 +1,23 @@
-from typing import TYPE_CHECKING
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
-import scipy.stats
 
 from quantopy.stats import (
+    _utils,
     financial,
     stats,
 )
 
-if TYPE_CHECKING:
+
+@lru_cache(maxsize=None)
+def _return_data_frame():
+    # ReturnDataFrame imports this module, so it can only be resolved lazily. The class
+    # is cached after the first call to keep the import out of every pandas operation.
     from quantopy.core.return_frame import ReturnDataFrame
 
+    return ReturnDataFrame
+
 
 class ReturnSeries(pd.Series):
     @property
@@ -24,9 +30,7 @@ class ReturnSeries(pd.Series):
         Used when a manipulation result has one higher dimension as the
         original, such as ReturnSeries.to_frame()
         """
-        from quantopy.core.return_frame import ReturnDataFrame
-
-        return ReturnDataFrame
+        return _return_data_frame()
 
     @classmethod
     def from_price(cls, price) -> "ReturnSeries":
@@ -64,8 +68,9 @@ class ReturnSeries(pd.Series):
         2    0.333333
         dtype: float64
         """
+        # Prices are only read, so array-like input does not need to be copied
         return financial.get_simple_returns_from_price(
-            ReturnSeries(price, dtype="float64")
+            ReturnSeries(price, dtype="float64", copy=False)
         )
 
     def cumulated(self) -> "ReturnSeries":
@@ -87,14 +92,15 @@ class ReturnSeries(pd.Series):
         """
         return financial.cumulated(self)
 
-    def mean(self) -> np.float64:
+    def mean(self) -> np.floating:
         """
         Compute the arithmetic mean of pasts returns.
 
         Returns
         -------
-        np.float64
-            The arithmetic mean of past returns.
+        np.floating
+            The arithmetic mean of past returns, as a np.float32 for float32 returns
+            and a np.float64 otherwise.
 
         Examples
         --------
@@ -102,9 +108,13 @@ class ReturnSeries(pd.Series):
         >>> rs.mean()
         0.06999
         """
-        return super().mean()
+        values = _utils.dense_values(self)
+        if values is None:
+            return super().mean()
 
-    def gmean(self) -> np.float64:
+        return _utils.wrap_reduction(self, _utils.mean(values))
+
+    def gmean(self) -> np.floating:
         """
         Compute the geometric mean of series of returns. Commonly used to determine the
         performance results of an investment or portfolio.
@@ -133,7 +143,7 @@ class ReturnSeries(pd.Series):
     def annualized(
         self,
         period: stats.period = stats.period.MONTHLY,
-    ) -> np.float64:
+    ) -> np.floating:
         """
         Determines the annualized rate of return. Commonly used for comparison
         of investment that have different time lenghts.
@@ -167,7 +177,7 @@ class ReturnSeries(pd.Series):
 
     def sharpe_ratio(
         self, riskfree_rate: float, period: stats.period = stats.period.MONTHLY
-    ) -> np.float64:
+    ) -> np.floating:
         """Compute the sharpe ratio. Commonly used to measure the performance of an investment compared
         to a risk-free asset, after adjusting for its risk.
 
@@ -194,13 +204,13 @@ class ReturnSeries(pd.Series):
         """
         return financial.sharpe(self, riskfree_rate, period)
 
-    def drawdown(self) -> "ReturnDataFrame":
+    def drawdown(self) -> "ReturnSeries":
         """Compute the maximum drawdown in series of simple returns. Commonly used to measure the risk
         of a portfolio.
 
         Returns
         -------
-        out : qp.ReturnDataFrame
+        out : qp.ReturnSeries
 
         References
         ----------
@@ -208,10 +218,24 @@ class ReturnSeries(pd.Series):
         """
         return financial.drawdown(self)
 
+    def max_drawdown(self) -> np.floating:
+        """Compute the largest drawdown in series of simple returns, i.e. the worst peak to
+        trough decline.
+
+        Returns
+        -------
+        out : np.float64
+
+        References
+        ----------
+        .. [1] "Drawdown", *Wikipedia*, https://en.wikipedia.org/wiki/Drawdown_(economics).
+        """
+        return financial.max_drawdown(self)
+
     def effect_vol(
         self,
         period: stats.period = stats.period.MONTHLY,
-    ) -> np.float64:
+    ) -> np.floating:
         """
         Determines the annual effective annual volatility.
 
@@ -227,7 +251,7 @@ class ReturnSeries(pd.Series):
         """
         return stats.effect_vol(self, period)
 
-    def total_return(self) -> np.float64:
+    def total_return(self) -> np.floating:
         """
         Compute total returns.
 
@@ -237,15 +261,20 @@ class ReturnSeries(pd.Series):
         """
         return stats.total_return(self)
 
-    def log(self):
-        return (self + 1).apply(np.log)  # type: ignore
+    def log(self) -> "ReturnSeries":
+        return np.log1p(self)
 
-    def skew(self):
-        return scipy.stats.skew(self)
+    def skew(self) -> np.floating:
+        skew, _ = _utils.skew_kurtosis(self)
+        return _utils.wrap_reduction(self, skew)
 
-    def kurtosis(self):
-        return scipy.stats.kurtosis(self) + 3
+    def kurtosis(self) -> np.floating:
+        _, kurtosis = _utils.skew_kurtosis(self)
+        return _utils.wrap_reduction(self, kurtosis)
 
     def is_normal(self, pvalue=0.01):
-        jb_value, p = scipy.stats.jarque_bera(self)
-        return p > pvalue
+        # Jarque-Bera test: the statistic follows a chi-squared distribution with two
+        # degrees of freedom, whose survival function is exp(-x / 2).
+        skew, kurtosis = _utils.skew_kurtosis(self)
+        jb_value = len(self) / 6 * (skew ** 2 + (kurtosis - 3) ** 2 / 4)
+        return np.exp(-jb_value / 2) > pvalue
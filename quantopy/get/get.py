@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from pandas_datareader import famafrench
 import pandas_datareader.data as web
@@ -29,7 +31,15 @@ def get_available_datasets(data_source):
         return famafrench.get_available_datasets()
 
 
-def get(name, data_source=None, start=None, end=None, retry_count=3, pause=0.1):
+def get(
+    name,
+    data_source=None,
+    start=None,
+    end=None,
+    retry_count=3,
+    pause=0.1,
+    session=None,
+):
     """
     Imports data from a number of online sources.
 
@@ -38,8 +48,9 @@ def get(name, data_source=None, start=None, end=None, retry_count=3, pause=0.1):
     Parameters
     ----------
     name : str or list of strs
-        the name of the dataset. Some data sources (IEX, fred) will
-        accept a list of names.
+        the name of the dataset. If a list of names is given, the datasets are
+        returned in a dict keyed by name. They are downloaded concurrently unless a
+        session is given.
     data_source: {str, None}
         the data source ("famafrench")
     start : string, int, date, datetime, Timestamp
@@ -51,6 +62,11 @@ def get(name, data_source=None, start=None, end=None, retry_count=3, pause=0.1):
     pause : {numeric, 0.001}
         Time, in seconds, to pause between consecutive queries of chunks. If
         single value given for symbol, represents the pause between retries.
+    session : Session, default None
+        requests.sessions.Session instance to be used. Passing a caching session
+        (e.g. from requests-cache) avoids downloading the same dataset again.
+        Sessions are not thread-safe, so a list of datasets is downloaded one by one
+        when a session is given.
 
     Examples
     ----------
@@ -60,6 +76,7 @@ def get(name, data_source=None, start=None, end=None, retry_count=3, pause=0.1):
     ff = get("F-F_Research_Data_Factors_weekly", "famafrench")
     ff = get("6_Portfolios_2x3", "famafrench")
     ff = get("F-F_ST_Reversal_Factor", "famafrench")
+    ff = get(["F-F_Research_Data_Factors", "F-F_Momentum_Factor"], "famafrench")
     """
     expected_source = ["famafrench"]
 
@@ -70,6 +87,29 @@ def get(name, data_source=None, start=None, end=None, retry_count=3, pause=0.1):
     if data_source == "famafrench" and start is None:
         start = "1926-07"
 
+    if isinstance(name, (list, tuple)):
+        if session is not None:
+            # The caller's session (and requests-cache's SQLite backend) cannot be
+            # shared between threads, so the datasets are downloaded sequentially
+            return {
+                n: _get_dataset(n, data_source, start, end, retry_count, pause, session)
+                for n in name
+            }
+
+        # Each dataset is a separate download, so the requests can overlap
+        with ThreadPoolExecutor(max_workers=min(8, len(name)) or 1) as executor:
+            datasets = executor.map(
+                lambda n: _get_dataset(
+                    n, data_source, start, end, retry_count, pause, session
+                ),
+                name,
+            )
+            return dict(zip(name, datasets))
+
+    return _get_dataset(name, data_source, start, end, retry_count, pause, session)
+
+
+def _get_dataset(name, data_source, start, end, retry_count, pause, session):
     ds = web.DataReader(
         name,
         data_source=data_source,
@@ -77,12 +117,18 @@ def get(name, data_source=None, start=None, end=None, retry_count=3, pause=0.1):
         end=end,
         retry_count=retry_count,
         pause=pause,
+        session=session,
     )
 
     for key, value in ds.items():
         if key != "DESCR":
-            value[value <= -99.99] = np.nan
-
-            ds[key] = ReturnDataFrame(value) / 100
+            # Missing values are coded as -99.99 (or -999) in percent units
+            values = value.to_numpy(dtype="float64", copy=True)
+            np.putmask(values, values <= -99.99, np.nan)
+            values /= 100
+
+            ds[key] = ReturnDataFrame(
+                values, index=value.index, columns=value.columns, copy=False
+            )
 
     return ds
@@ -0,0 +1,54 @@
+import numpy as np
+from numpy.testing import assert_allclose
+import pandas as pd
+import pandas_datareader.data as web
+import pytest
+
+import quantopy as qp
+
+
+@pytest.fixture
+def data_reader(monkeypatch):
+    calls = []
+
+    def fake_data_reader(name, **kwargs):
+        calls.append((name, kwargs))
+        return {
+            0: pd.DataFrame({"Mkt-RF": [2.5, -99.99], "SMB": [-1.0, 0.5]}),
+            "DESCR": name,
+        }
+
+    monkeypatch.setattr(web, "DataReader", fake_data_reader)
+    return calls
+
+
+class TestGet:
+    def test_get(self, data_reader) -> None:
+        ds = qp.get("F-F_Research_Data_Factors", "famafrench")
+
+        assert type(ds[0]) is qp.ReturnDataFrame
+        assert ds["DESCR"] == "F-F_Research_Data_Factors"
+        assert_allclose(ds[0], [[0.025, -0.01], [np.nan, 0.005]])
+
+        assert data_reader[0][1]["start"] == "1926-07"
+
+    def test_list(self, data_reader) -> None:
+        names = ["F-F_Research_Data_Factors", "F-F_Momentum_Factor"]
+        datasets = qp.get(names, "famafrench")
+
+        assert list(datasets) == names
+        for name, ds in datasets.items():
+            assert ds["DESCR"] == name
+            assert_allclose(ds[0], [[0.025, -0.01], [np.nan, 0.005]])
+
+    def test_session(self, data_reader) -> None:
+        session = object()
+        datasets = qp.get(["a", "b"], "famafrench", session=session)
+
+        assert list(datasets) == ["a", "b"]
+        assert [name for name, _ in data_reader] == ["a", "b"]
+        assert all(kwargs["session"] is session for _, kwargs in data_reader)
+
+    def test_data_source(self) -> None:
+        with pytest.raises(NotImplementedError):
+            qp.get("F-F_Research_Data_Factors", "yahoo")
@@ -12,8 +12,47 @@ from quantopy._typing import PythonScalar
 from quantopy.core.return_frame import ReturnDataFrame
 from quantopy.core.return_series import ReturnSeries
 
+_RNG = np.random.default_rng()
 
-def normal_returns(mu: np.ndarray, sigma: np.ndarray, size: int) -> np.ndarray:
+
+def seed(seed: Optional[int] = None) -> None:
+    """Seed the random number generator used to simulate returns and prices.
+
+    Parameters
+    ----------
+    seed : int, optional
+        Seed passed to numpy.random.default_rng. If None, fresh entropy is pulled
+        from the OS.
+    """
+    global _RNG
+    _RNG = np.random.default_rng(seed)
+
+
+def _normal(
+    mu: np.ndarray, sigma: np.ndarray, shape, dtype="float64", out=None
+) -> np.ndarray:
+    """Draw normal samples, scaling the standard normal draws in place."""
+    if isinstance(sigma, np.ndarray):
+        negative_sigma = (sigma < 0).any()
+    else:
+        negative_sigma = sigma < 0
+
+    if negative_sigma:
+        raise ValueError("sigma < 0")
+
+    if out is not None:
+        dtype = out.dtype
+
+    samples = _RNG.standard_normal(shape, dtype=dtype, out=out)
+    samples *= sigma
+    samples += mu
+
+    return samples
+
+
+def normal_returns(
+    mu: np.ndarray, sigma: np.ndarray, size: int, dtype="float64", *, out=None
+) -> np.ndarray:
     """Generate random simple returns from a normal (Gaussian) distribution.
 
     Parameters
@@ -29,6 +68,15 @@ def normal_returns(mu: np.ndarray, sigma: np.ndarray, size: int) -> np.ndarray:
         are drawn. If size is None (default), a single value is returned if mu and sigma
         are both scalars. Otherwise, np.broadcast(mu, sigma).size samples are drawn.
 
+    dtype : {"float64", "float32"}, default "float64"
+        Floating point type of the samples. float32 halves the memory used by
+        large simulations, at the cost of precision.
+
+    out : ndarray, optional
+        Alternative output array in which to place the result, e.g. to reuse one
+        buffer across many simulations. It must have shape (size,) + mu.shape, and
+        its dtype is used instead of 'dtype'.
+
     Returns
     -------
     out : ndarray or scalar
@@ -38,10 +86,12 @@ def normal_returns(mu: np.ndarray, sigma: np.ndarray, size: int) -> np.ndarray:
     ----------
     .. [1] "Normal distribution", *Wikipedia*, https://en.wikipedia.org/wiki/Normal_distribution.
     """
-    return np.random.normal(mu, sigma, (size,) + mu.shape)
+    return _normal(mu, sigma, (size,) + np.shape(mu), dtype, out)
 
 
-def log_normal_returns(mu: np.ndarray, sigma: np.ndarray, size: int) -> np.ndarray:
+def log_normal_returns(
+    mu: np.ndarray, sigma: np.ndarray, size: int, dtype="float64", *, out=None
+) -> np.ndarray:
     """Generate random simple returns from a log-normal distribution.
 
     Parameters
@@ -57,6 +107,15 @@ def log_normal_returns(mu: np.ndarray, sigma: np.ndarray, size: int) -> np.ndarr
         are drawn. If size is None (default), a single value is returned if mu and sigma
         are both scalars. Otherwise, np.broadcast(mu, sigma).size samples are drawn.
 
+    dtype : {"float64", "float32"}, default "float64"
+        Floating point type of the samples. float32 halves the memory used by
+        large simulations, at the cost of precision.
+
+    out : ndarray, optional
+        Alternative output array in which to place the result, e.g. to reuse one
+        buffer across many simulations. It must have shape (size,) + mu.shape, and
+        its dtype is used instead of 'dtype'.
+
     Returns
     -------
     out : ndarray or scalar
@@ -67,9 +126,52 @@ def log_normal_returns(mu: np.ndarray, sigma: np.ndarray, size: int) -> np.ndarr
     .. [1] "Log-Normal distribution", *Wikipedia*,
                 https://en.wikipedia.org/wiki/Log-normal_distribution.
     """
-    log_returns = np.random.normal(mu, sigma, (size,) + mu.shape)
+    log_returns = _normal(mu, sigma, (size,) + np.shape(mu), dtype, out)
+
+    return np.expm1(log_returns, out=log_returns)
+
+
+def multivariate_normal_returns(
+    mu: np.ndarray, cov: np.ndarray, size: int, dtype="float64"
+) -> np.ndarray:
+    """Generate random correlated simple returns from a multivariate normal distribution.
+
+    Parameters
+    ----------
+    mu : array_like of floats
+        Mean of each asset's returns, of length N.
+
+    cov : array_like of floats
+        Covariance matrix of the returns, of shape (N, N). Must be symmetric and
+        positive-definite.
+
+    size : int
+        Number of periods to draw.
+
+    dtype : {"float64", "float32"}, default "float64"
+        Floating point type of the samples. float32 halves the memory used by
+        large simulations, at the cost of precision.
+
+    Returns
+    -------
+    out : ndarray
+        Drawn samples, of shape (size, N).
+
+    References
+    ----------
+    .. [1] "Multivariate normal distribution", *Wikipedia*,
+                https://en.wikipedia.org/wiki/Multivariate_normal_distribution.
+    """
+    mu = np.asarray(mu)
 
-    return np.exp(log_returns) - 1
+    # Independent standard normal draws are correlated by the Cholesky factor of the
+    # covariance (cov = L @ L.T), applied to all periods in a single matrix product
+    cholesky = np.linalg.cholesky(cov).astype(dtype, copy=False)
+
+    samples = _RNG.standard_normal((size, len(mu)), dtype=dtype) @ cholesky.T
+    samples += mu
+
+    return samples
 
 
 # def geometric_brownian_motion(
@@ -110,9 +212,30 @@ def log_normal_returns(mu: np.ndarray, sigma: np.ndarray, size: int) -> np.ndarr
 #     return simulated_returns
 
 
+def _simulate_returns(mu, sigma, size, method, dtype) -> np.ndarray:
+    """Generate simple returns from a given method as a freshly allocated ndarray."""
+    if not (np.isscalar(mu) and np.isscalar(sigma)):
+        # Scalars are used as is, which avoids building and broadcasting 0-d arrays
+        mu = np.asarray(mu)
+        sigma = np.asarray(sigma)
+
+    if method == "normal":
+        return normal_returns(mu, sigma, size, dtype)
+    elif method == "lognormal":
+        return log_normal_returns(mu, sigma, size, dtype)
+    # elif method == "gbm":
+    #     return geometric_brownian_motion(mu, sigma, size)
+    else:
+        raise ValueError(f"Invalid method {method}")
+
+
 @overload
 def returns(
-    mu: PythonScalar, sigma: PythonScalar, size: Optional[int] = None, method: str = ...
+    mu: PythonScalar,
+    sigma: PythonScalar,
+    size: Optional[int] = None,
+    method: str = ...,
+    dtype=...,
 ) -> ReturnSeries:
     ...
 
@@ -123,11 +246,12 @@ def returns(
     sigma: Union[List[int], List[float]],
     size: Optional[int] = None,
     method: str = ...,
+    dtype=...,
 ) -> ReturnDataFrame:
     ...
 
 
-def returns(mu, sigma, size=None, method="normal"):
+def returns(mu, sigma, size=None, method="normal", dtype="float64"):
     """Generate simple returns from a given method:
         - 'normal': gaussian distribution
         - 'lognormal': gaussian distribution
@@ -149,6 +273,10 @@ def returns(mu, sigma, size=None, method="normal"):
     method: str
         The name of a method used for returns generation
 
+    dtype : {"float64", "float32"}, default "float64"
+        Floating point type of the samples. float32 halves the memory used by
+        large simulations, at the cost of precision.
+
     Returns
     -------
     out : ndarray or scalar
@@ -165,22 +293,13 @@ def returns(mu, sigma, size=None, method="normal"):
     .. [2] "Geometric Brownian Motion", *Wikipedia*,
                 https://en.wikipedia.org/wiki/Geometric_Brownian_motion.
     """
-    mu = np.asarray(mu)
-    sigma = np.asarray(sigma)
-
-    if method == "normal":
-        simulated_returns = normal_returns(mu, sigma, size)
-    elif method == "lognormal":
-        simulated_returns = log_normal_returns(mu, sigma, size)
-    # elif method == "gbm":
-    #     simulated_returns = geometric_brownian_motion(mu, sigma, size)
-    else:
-        raise ValueError(f"Invalid method {method}")
+    simulated_returns = _simulate_returns(mu, sigma, size, method, dtype)
 
+    # The simulated returns are a fresh buffer, so they are wrapped without a copy
     if len(simulated_returns.shape) == 1:
-        return ReturnSeries(simulated_returns)
+        return ReturnSeries(simulated_returns, copy=False)
     else:
-        return ReturnDataFrame(simulated_returns)
+        return ReturnDataFrame(simulated_returns, copy=False)
 
 
 @overload
@@ -190,6 +309,7 @@ def prices(
     sigma: PythonScalar,
     size: Optional[int] = None,
     method: str = ...,
+    dtype=...,
 ) -> ReturnSeries:
     ...
 
@@ -201,11 +321,12 @@ def prices(
     sigma: Union[List[int], List[float]],
     size: Optional[int] = None,
     method: str = ...,
+    dtype=...,
 ) -> ReturnDataFrame:
     ...
 
 
-def prices(initial_price, mu, sigma, size=None, method="normal"):
+def prices(initial_price, mu, sigma, size=None, method="normal", dtype="float64"):
     """Generate price evolution from a given method for returns distribution:
         - 'normal': gaussian distribution
         - 'gbr': geometric brownian motion
@@ -228,6 +349,10 @@ def prices(initial_price, mu, sigma, size=None, method="normal"):
     method: str
         The name of a method used for returns generation
 
+    dtype : {"float64", "float32"}, default "float64"
+        Floating point type of the samples. float32 halves the memory used by
+        large simulations, at the cost of precision.
+
     Returns
     -------
     out : ndarray or scalar
@@ -244,16 +369,36 @@ def prices(initial_price, mu, sigma, size=None, method="normal"):
     .. [2] "Geometric Brownian Motion", *Wikipedia*,
                 https://en.wikipedia.org/wiki/Geometric_Brownian_motion.
     """
-    simulated_returns = returns(mu, sigma, size - 1, method)
+    if method == "lognormal":
+        # Log-normal prices are a geometric random walk, so the normal log returns are
+        # summed and exponentiated once instead of multiplying exp(x) terms
+        if not (np.isscalar(mu) and np.isscalar(sigma)):
+            mu = np.asarray(mu)
+            sigma = np.asarray(sigma)
+        increments = _normal(mu, sigma, (size - 1,) + np.shape(mu), dtype)
+    else:
+        increments = _simulate_returns(mu, sigma, size - 1, method, dtype)
+        increments += 1
 
     # if method == "gbm":
     #     simulated_returns = np.exp(simulated_returns)
 
-    simulated_prices = initial_price * (simulated_returns + 1).cumprod()
-
-    if len(simulated_returns.shape) == 1:
-        simulated_prices = pd.concat([pd.Series([initial_price]), simulated_prices])
+    # Prices are the initial price followed by the cumulated returns, written straight
+    # into a single buffer instead of concatenating pandas objects
+    simulated_prices = np.empty(
+        (len(increments) + 1,) + increments.shape[1:], dtype=increments.dtype
+    )
+    simulated_prices[0] = initial_price
+
+    cumulated = simulated_prices[1:]
+    if method == "lognormal":
+        np.cumsum(increments, axis=0, out=cumulated)
+        np.exp(cumulated, out=cumulated)
     else:
-        simulated_prices = pd.concat([pd.DataFrame([initial_price]), simulated_prices])
+        np.multiply.accumulate(increments, axis=0, out=cumulated)
+    cumulated *= initial_price
 
-    return simulated_prices
+    if simulated_prices.ndim == 1:
+        return pd.Series(simulated_prices, copy=False)
+    else:
+        return pd.DataFrame(simulated_prices, copy=False)
@@ -8,10 +8,18 @@ import quantopy as qp
 
 @pytest.fixture(autouse=True)
 def random():
-    np.random.seed(0)
+    qp.random.seed(0)
 
 
 class TestGenerator:
+    def test_seed(self) -> None:
+        rs = qp.random.generator.returns(0, 0.1, 100)
+        qp.random.seed(0)
+        pd.testing.assert_series_equal(qp.random.generator.returns(0, 0.1, 100), rs)
+
+        with pytest.raises(ValueError):
+            qp.random.generator.returns(0, -0.1, 100)
+
     def test_returns_normal(self) -> None:
         # Test single mu and sigma
         mu, sigma = 0, 0.1  # mean and standard deviation
@@ -36,6 +44,31 @@ class TestGenerator:
         assert_almost_equal(rdf.iloc[:, 1].mean(), mu_list[1], decimal=2)
         assert_almost_equal(rdf.iloc[:, 1].std(), sigma_list[1], decimal=2)
 
+    def test_returns_float32(self) -> None:
+        rs = qp.random.generator.returns(0, 0.1, 10000, dtype="float32")
+        assert rs.dtype == np.float32
+        assert_almost_equal(rs.std(), 0.1, decimal=2)
+
+        rdf = qp.random.generator.returns(
+            [0, 1], [0.1, 0.2], 100, "lognormal", "float32"
+        )
+        assert (rdf.dtypes == np.float32).all()
+
+    def test_out(self) -> None:
+        out = np.empty((10000, 2))
+        returns = qp.random.generator.normal_returns(
+            np.array([0, 1]), np.array([0.1, 0.2]), 10000, out=out
+        )
+        assert returns is out
+        assert_almost_equal(out.mean(axis=0), [0, 1], decimal=2)
+
+        out = np.empty((10000, 1), dtype=np.float32)
+        returns = qp.random.generator.log_normal_returns(
+            np.array([0.0]), np.array([0.1]), 10000, out=out
+        )
+        assert returns is out
+        assert_almost_equal(np.log1p(out).std(), 0.1, decimal=2)
+
     def test_returns_lognormal(self) -> None:
         # Test single mu and sigma
         mu, sigma = 0, 0.1  # mean and standard deviation
@@ -88,6 +121,15 @@ class TestGenerator:
     #     assert_almost_equal(rdf.iloc[:, 1].mean(), mu_list[1], decimal=1)
     #     assert_almost_equal(rdf.iloc[:, 1].std(), sigma_list[1], decimal=2)
 
+    def test_multivariate_normal_returns(self) -> None:
+        mu = np.array([0.01, 0.02])
+        cov = np.array([[0.01, 0.006], [0.006, 0.04]])
+        returns = qp.random.generator.multivariate_normal_returns(mu, cov, 100000)
+
+        assert returns.shape == (100000, 2)
+        assert_almost_equal(returns.mean(axis=0), mu, decimal=2)
+        assert_almost_equal(np.cov(returns, rowvar=False), cov, decimal=3)
+
     def test_prices_normal(self) -> None:
         # Test single mu and sigma
         mu, sigma = 0, 0.1  # mean and standard deviation
@@ -95,6 +137,8 @@ class TestGenerator:
         ps = qp.random.generator.prices(initial_price, mu, sigma, 10000)
         rs = qp.ReturnSeries.from_price(ps)
         assert type(ps) is pd.Series
+        assert ps.iloc[0] == initial_price
+        assert ps.index.equals(pd.RangeIndex(10000))
 
         assert_almost_equal(rs.mean(), mu, decimal=2)
         assert_almost_equal(rs.std(), sigma, decimal=2)
@@ -0,0 +1,180 @@
+"""
+Helpers to move between quantopy objects and their underlying ndarray.
+
+Plain ndarrays are accepted wherever a ReturnSeries or ReturnDataFrame is, so the
+stats functions can be called on raw values without any pandas wrapping. Results
+for ndarray inputs are returned as ndarrays (or np.float64 for 1-d reductions).
+
+This module is only intended for internal use.
+"""
+
+import numpy as np
+
+
+def values_of(simple_returns, dtype=None, copy: bool = False) -> np.ndarray:
+    """The values of 'simple_returns' as an ndarray, copied only if requested."""
+    if isinstance(simple_returns, np.ndarray):
+        if copy:
+            return np.array(simple_returns, dtype=dtype)
+
+        return np.asarray(simple_returns, dtype=dtype)
+
+    return simple_returns.to_numpy(dtype=dtype, copy=copy)
+
+
+def wrap_like(simple_returns, values: np.ndarray, index=None):
+    """Wrap an ndarray with the same columns as 'simple_returns' into its class.
+
+    The index of 'simple_returns' is reused unless a new one is given. 'values' is
+    wrapped without a copy, so it must be a buffer owned by the caller.
+    """
+    if isinstance(simple_returns, np.ndarray):
+        return values
+
+    if index is None:
+        index = simple_returns.index
+
+    if simple_returns.ndim == 1:
+        result = simple_returns._constructor(
+            values, index=index, name=simple_returns.name, copy=False
+        )
+    else:
+        result = simple_returns._constructor(
+            values, index=index, columns=simple_returns.columns, copy=False
+        )
+
+    return result.__finalize__(simple_returns)
+
+
+def wrap_reduction(simple_returns, values: np.ndarray):
+    """Wrap the result of a column-wise reduction over 'simple_returns'.
+
+    A ReturnSeries reduces to a NumPy scalar of the result's dtype (np.float64, or
+    np.float32 for float32 returns) and a ReturnDataFrame to a ReturnSeries indexed by
+    its columns.
+    """
+    if simple_returns.ndim == 1:
+        return np.asarray(values)[()]
+
+    if isinstance(simple_returns, np.ndarray):
+        return values
+
+    return simple_returns._constructor_sliced(values, index=simple_returns.columns)
+
+
+def wealth_index(simple_returns) -> np.ndarray:
+    """Cumulated product of (1 + simple_returns) along the first axis.
+
+    Computed in place on a single float64 buffer. Missing values are skipped, as in
+    pandas' cumprod, and kept as NaN in the output.
+    """
+    values = values_of(simple_returns, dtype="float64", copy=True)
+    values += 1
+
+    missing = np.isnan(values)
+    if missing.any():
+        values[missing] = 1
+        np.multiply.accumulate(values, axis=0, out=values)
+        values[missing] = np.nan
+    else:
+        np.multiply.accumulate(values, axis=0, out=values)
+
+    return values
+
+
+def drawdown(simple_returns) -> np.ndarray:
+    """Drawdown from the running peak of the wealth index, along the first axis."""
+    # 1. Compute a wealth index
+    wealth = wealth_index(simple_returns)
+
+    # 2. Compute previous peaks, skipping missing values like pandas' cummax
+    previous_peaks = np.fmax.accumulate(wealth, axis=0)
+
+    # 3. Compute drawdown - which is the wealth value as a percentage of the previous peak.
+    # The wealth index buffer is reused to hold the result.
+    with np.errstate(invalid="ignore"):
+        drawdowns = np.divide(wealth, previous_peaks, out=wealth)
+    drawdowns -= 1
+
+    return drawdowns
+
+
+def mean_log_return(simple_returns) -> np.ndarray:
+    """Arithmetic mean of log(1 + simple_returns) along the first axis."""
+    with np.errstate(divide="ignore"):
+        log_returns = np.log1p(values_of(simple_returns, dtype="float64"))
+
+    return log_returns.mean(axis=0)
+
+
+def float_values(simple_returns) -> np.ndarray:
+    """The values of 'simple_returns' as float32 if they already are, float64 otherwise."""
+    values = values_of(simple_returns)
+    if values.dtype != np.float32:
+        values = values.astype("float64", copy=False)
+
+    return values
+
+
+def dense_values(simple_returns, min_count: int = 1):
+    """Floating point values of 'simple_returns' when NumPy can reduce them directly.
+
+    float32 data is kept as is, so it is not copied, and any other dtype is converted to
+    float64. Use mean() and std() to reduce the values in float64 precision. Returns None
+    if any value is missing or there are fewer than 'min_count' rows, in which case
+    callers should fall back to the pandas reductions. ndarray inputs are always reduced
+    by NumPy, so missing values propagate.
+    """
+    values = float_values(simple_returns)
+
+    if isinstance(simple_returns, np.ndarray):
+        return values
+
+    if len(values) < min_count or np.isnan(values).any():
+        return None
+
+    return values
+
+
+def mean(values: np.ndarray) -> np.ndarray:
+    """Arithmetic mean along the first axis, accumulated in float64.
+
+    The result has the dtype of 'values', so float32 inputs keep their dtype without
+    losing precision in the sum over long histories.
+    """
+    return values.mean(axis=0, dtype="float64").astype(values.dtype, copy=False)
+
+
+def std(values: np.ndarray) -> np.ndarray:
+    """Sample standard deviation along the first axis, accumulated in float64.
+
+    The result has the dtype of 'values', as for mean().
+    """
+    return values.std(axis=0, ddof=1, dtype="float64").astype(values.dtype, copy=False)
+
+
+def skew_kurtosis(simple_returns):
+    """Sample skewness and (non-excess) kurtosis of 'simple_returns' along the first axis.
+
+    Both are computed from a single set of deviations from the mean, and match the
+    biased estimators of scipy.stats.skew and scipy.stats.kurtosis(fisher=False).
+    Columns with (numerically) zero variance give NaN for both, as in scipy.
+    """
+    values = values_of(simple_returns, dtype="float64")
+
+    column_means = values.mean(axis=0)
+    deviations = values - column_means
+    squared_deviations = deviations * deviations
+
+    m2 = squared_deviations.mean(axis=0)
+    m3 = (squared_deviations * deviations).mean(axis=0)
+    m4 = (squared_deviations * squared_deviations).mean(axis=0)
+
+    # Otherwise the moments of a constant column would only be rounding noise
+    zero_variance = m2 <= (np.finfo(np.float64).resolution * column_means) ** 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        skew = np.where(zero_variance, np.nan, m3 / m2 ** 1.5)
+        kurtosis = np.where(zero_variance, np.nan, m4 / (m2 * m2))
+
+    return skew, kurtosis
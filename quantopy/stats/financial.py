@@ -1,11 +1,17 @@
 from typing import (
     TYPE_CHECKING,
+    Union,
     overload,
 )
 
 import numpy as np
 
-from quantopy.stats.period import period
+from quantopy.stats import _utils
+from quantopy.stats.period import (
+    _sqrt_annualization_factor,
+    annualization_factor,
+    period,
+)
 
 if TYPE_CHECKING:
     from quantopy.core.return_frame import ReturnDataFrame
@@ -22,11 +28,29 @@ def get_simple_returns_from_price(price: "ReturnDataFrame") -> "ReturnDataFrame"
     ...
 
 
+@overload
+def get_simple_returns_from_price(price: np.ndarray) -> np.ndarray:
+    ...
+
+
 def get_simple_returns_from_price(price):
     """Generate simple returns from given prices.
     This function is only intended for internal use.
+
+    Missing prices propagate to the adjacent returns instead of being padded, as in
+    pct_change. ndarray prices are converted without any pandas wrapping, and float32
+    prices give float32 returns.
     """
-    return price.pct_change()[1:]
+    values = _utils.float_values(price)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        simple_returns = values[1:] / values[:-1]
+    simple_returns -= 1
+
+    if isinstance(price, np.ndarray):
+        return simple_returns
+
+    return _utils.wrap_like(price, simple_returns, index=price.index[1:])
 
 
 @overload
@@ -39,6 +63,11 @@ def cumulated(simple_returns: "ReturnDataFrame") -> "ReturnDataFrame":
     ...
 
 
+@overload
+def cumulated(simple_returns: np.ndarray) -> np.ndarray:
+    ...
+
+
 def cumulated(simple_returns):
     """Computes cumulated indexed values from simple returns.
 
@@ -54,13 +83,13 @@ def cumulated(simple_returns):
     2    2.0
     dtype: float64
     """
-    return (simple_returns + 1).cumprod()
+    return _utils.wrap_like(simple_returns, _utils.wealth_index(simple_returns))
 
 
 @overload
 def sharpe(
     simple_returns: "ReturnSeries", riskfree_rate: float, period: period = ...
-) -> np.float64:
+) -> np.floating:
     ...
 
 
@@ -71,6 +100,13 @@ def sharpe(
     ...
 
 
+@overload
+def sharpe(
+    simple_returns: np.ndarray, riskfree_rate: float, period: period = ...
+) -> Union[np.floating, np.ndarray]:
+    ...
+
+
 def sharpe(simple_returns, riskfree_rate, period=period.MONTHLY):
     """Compute the sharpe ratio of series of returns. Commonly used to measure the performance
     of an investment compared to a risk-free asset, after adjusting for its risk.
@@ -80,7 +116,7 @@ def sharpe(simple_returns, riskfree_rate, period=period.MONTHLY):
 
     Parameters
     ----------
-    simple_returns : qp.ReturnDataFrame or qp.ReturnSeries
+    simple_returns : qp.ReturnDataFrame, qp.ReturnSeries or np.ndarray
         Input array or object that can be converted to an array.
 
     riskfree_rate: float
@@ -98,9 +134,63 @@ def sharpe(simple_returns, riskfree_rate, period=period.MONTHLY):
     ----------
     .. [1] "Sharpe Ratio", *Wikipedia*, https://en.wikipedia.org/wiki/Sharpe_ratio.
     """
-    excess_return = simple_returns.annualized(period) - riskfree_rate
+    values = _utils.dense_values(simple_returns, min_count=2)
+    if values is None:
+        excess_return = simple_returns.annualized(period) - riskfree_rate
+
+        return excess_return / simple_returns.effect_vol(period)
+
+    # Same as annualized() and effect_vol(), without wrapping the intermediate results
+    ann_factor = annualization_factor[period]
+    annualized_return = np.expm1(_utils.mean_log_return(simple_returns) * ann_factor)
+    effective_volatility = _utils.std(values) * _sqrt_annualization_factor[period]
+
+    return _utils.wrap_reduction(
+        simple_returns, (annualized_return - riskfree_rate) / effective_volatility
+    )
+
+
+def rolling_sharpe(simple_returns, riskfree_rate, window, period=period.MONTHLY):
+    """Compute the sharpe ratio of series of returns over a rolling window.
+
+    Each value is the sharpe ratio of the 'window' returns ending at that row, as
+    computed by sharpe(). The rolling means and standard deviations are updated
+    incrementally by pandas, so the cost does not grow with the window size.
+
+    Parameters
+    ----------
+    simple_returns : qp.ReturnDataFrame or qp.ReturnSeries
+        The simple returns series.
+
+    riskfree_rate: float
+        Risk free rate, with the same periodicity as simple returns (e.g. daily, monthly, ...).
+
+    window : int
+        Number of periods in each window.
+
+    period : period, default period.MONTHLY
+        Defines the periodicity of the 'returns' data for purposes of
+        annualizing.
+
+    Returns
+    -------
+    sharpe_ratio : qp.ReturnDataFrame or qp.ReturnSeries
+        The first 'window' - 1 values are NaN.
+
+    See Also
+    --------
+    sharpe: Sharpe ratio over the whole series.
+    """
+    log_returns = np.log1p(simple_returns)
 
-    return excess_return / simple_returns.effect_vol(period)
+    annualized_return = np.expm1(
+        log_returns.rolling(window).mean() * annualization_factor[period]
+    )
+    effective_volatility = (
+        simple_returns.rolling(window).std() * _sqrt_annualization_factor[period]
+    )
+
+    return (annualized_return - riskfree_rate) / effective_volatility
 
 
 @overload
@@ -113,13 +203,18 @@ def drawdown(simple_returns: "ReturnDataFrame") -> "ReturnDataFrame":
     ...
 
 
+@overload
+def drawdown(simple_returns: np.ndarray) -> np.ndarray:
+    ...
+
+
 def drawdown(simple_returns):
     """Compute the maximum drawdown in series of simple returns. Commonly used to measure the risk
     of a portfolio.
 
     Parameters
     ----------
-    simple_returns : qp.ReturnDataFrame or qp.ReturnSeries
+    simple_returns : qp.ReturnDataFrame, qp.ReturnSeries or np.ndarray
         Input array or object that can be converted to an array.
 
     Returns
@@ -130,13 +225,99 @@ def drawdown(simple_returns):
     ----------
     .. [1] "Drawdown", *Wikipedia*, https://en.wikipedia.org/wiki/Drawdown_(economics).
     """
-    # 1. Compute a wealth index
-    wealth_index = (1 + simple_returns).cumprod()
+    return _utils.wrap_like(simple_returns, _utils.drawdown(simple_returns))
+
+
+@overload
+def max_drawdown(simple_returns: "ReturnDataFrame") -> "ReturnSeries":
+    ...
+
+
+@overload
+def max_drawdown(simple_returns: "ReturnSeries") -> np.floating:
+    ...
+
+
+@overload
+def max_drawdown(simple_returns: np.ndarray) -> Union[np.floating, np.ndarray]:
+    ...
 
-    # 2. Compute previous peaks
-    previous_peaks = wealth_index.cummax()
 
-    # 3. Compute drawdown - which is the wealth value as a percentage of the previous peak
-    drawdown = (wealth_index - previous_peaks) / previous_peaks
+def max_drawdown(simple_returns):
+    """Compute the largest drawdown in series of simple returns, i.e. the worst peak to
+    trough decline, as a negative fraction of the peak.
 
-    return drawdown
+    Parameters
+    ----------
+    simple_returns : qp.ReturnDataFrame, qp.ReturnSeries or np.ndarray
+        Input array or object that can be converted to an array.
+
+    Returns
+    -------
+    max_drawdown : qp.ReturnSeries or np.float64
+
+    See Also
+    --------
+    drawdown: Drawdown at every period.
+
+    References
+    ----------
+    .. [1] "Drawdown", *Wikipedia*, https://en.wikipedia.org/wiki/Drawdown_(economics).
+    """
+    # Reduced straight from the drawdown buffer, without wrapping the whole path.
+    # fmin skips missing values, and columns with no values at all reduce to NaN.
+    return _utils.wrap_reduction(
+        simple_returns,
+        np.fmin.reduce(_utils.drawdown(simple_returns), axis=0, initial=np.nan),
+    )
+
+
+def rolling_drawdown(simple_returns, window):
+    """Compute the maximum drawdown of series of returns over a rolling window.
+
+    Each value is the max_drawdown() of the 'window' returns ending at that row. All
+    windows are advanced together, so the cost is 'window' NumPy passes over the series
+    instead of one max_drawdown() call per row.
+
+    Parameters
+    ----------
+    simple_returns : qp.ReturnDataFrame, qp.ReturnSeries or np.ndarray
+        Input array or object that can be converted to an array.
+
+    window : int
+        Number of periods in each window.
+
+    Returns
+    -------
+    max_drawdown : qp.ReturnDataFrame, qp.ReturnSeries or np.ndarray
+        The first 'window' - 1 values are NaN, as are the windows with missing values.
+
+    See Also
+    --------
+    max_drawdown: Maximum drawdown over the whole series.
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1")
+
+    values = _utils.values_of(simple_returns, dtype="float64")
+    n_windows = len(values) - window + 1
+
+    rolling_max_drawdown = np.full(values.shape, np.nan)
+    if n_windows > 0:
+        # Row i of each buffer holds the state of the window starting at row i
+        wealth = values[:n_windows] + 1
+        previous_peaks = wealth.copy()
+        max_drawdowns = np.where(np.isnan(wealth), np.nan, 0.0)
+
+        # np.maximum and np.minimum propagate NaN, so windows with missing values stay NaN
+        with np.errstate(invalid="ignore"):
+            for step in range(1, window):
+                wealth *= values[step:][:n_windows] + 1
+                np.maximum(previous_peaks, wealth, out=previous_peaks)
+                np.minimum(
+                    max_drawdowns, wealth / previous_peaks - 1, out=max_drawdowns
+                )
+
+        rolling_max_drawdown[-n_windows:] = max_drawdowns
+
+    return _utils.wrap_like(simple_returns, rolling_max_drawdown)
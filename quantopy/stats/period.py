@@ -3,6 +3,8 @@ from enum import (
     auto,
 )
 
+import numpy as np
+
 
 class period(Enum):
     DAILY = auto()
@@ -21,3 +23,9 @@ annualization_factor = {
     period.SEMIANNUAL: 2,
     period.YEARLY: 1,
 }
+
+# Volatilities scale with the square root of the annualization factor. NumPy scalars keep
+# the results np.float64, also where they are computed by pandas.
+_sqrt_annualization_factor = {
+    p: np.sqrt(factor) for p, factor in annualization_factor.items()
+}
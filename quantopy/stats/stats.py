@@ -1,12 +1,14 @@
 from typing import (
     TYPE_CHECKING,
+    Union,
     overload,
 )
 
 import numpy as np
-import scipy.stats
 
+from quantopy.stats import _utils
 from quantopy.stats.period import (
+    _sqrt_annualization_factor,
     annualization_factor,
     period,
 )
@@ -17,7 +19,7 @@ if TYPE_CHECKING:
 
 
 @overload
-def gmean(simple_returns: "ReturnSeries") -> np.float64:
+def gmean(simple_returns: "ReturnSeries") -> np.floating:
     ...
 
 
@@ -28,6 +30,11 @@ def gmean(
     ...
 
 
+@overload
+def gmean(simple_returns: np.ndarray) -> Union[np.floating, np.ndarray]:
+    ...
+
+
 def gmean(simple_returns):
     """
     Compute the geometric mean of series of returns. Commonly used to determine the
@@ -38,7 +45,7 @@ def gmean(simple_returns):
 
     Parameters
     ----------
-    simple_returns : qp.ReturnDataFrame or qp.ReturnSeries
+    simple_returns : qp.ReturnDataFrame, qp.ReturnSeries or np.ndarray
         The simple returns series.
 
     Returns
@@ -65,7 +72,9 @@ def gmean(simple_returns):
     stock_2    0.080124
     dtype: float64
     """
-    return (simple_returns + 1).aggregate(scipy.stats.gmean) - 1
+    return _utils.wrap_reduction(
+        simple_returns, np.expm1(_utils.mean_log_return(simple_returns))
+    )
 
 
 @overload
@@ -76,7 +85,14 @@ def annualized(
 
 
 @overload
-def annualized(simple_returns: "ReturnSeries", period: period = ...) -> np.float64:
+def annualized(simple_returns: "ReturnSeries", period: period = ...) -> np.floating:
+    ...
+
+
+@overload
+def annualized(
+    simple_returns: np.ndarray, period: period = ...
+) -> Union[np.floating, np.ndarray]:
     ...
 
 
@@ -87,7 +103,7 @@ def annualized(simple_returns, period=period.MONTHLY):
 
     Parameters
     ----------
-    simple_returns : qp.ReturnSeries or qp.ReturnDataFrame
+    simple_returns : qp.ReturnSeries, qp.ReturnDataFrame or np.ndarray
         The simple returns series.
 
     period : period, default period.MONTHLY
@@ -116,7 +132,10 @@ def annualized(simple_returns, period=period.MONTHLY):
     """
     ann_factor = annualization_factor[period]
 
-    return (simple_returns.gmean() + 1) ** ann_factor - 1
+    # (gmean + 1) ** ann_factor - 1, computed in log space
+    return _utils.wrap_reduction(
+        simple_returns, np.expm1(_utils.mean_log_return(simple_returns) * ann_factor)
+    )
 
 
 @overload
@@ -127,7 +146,14 @@ def effect_vol(
 
 
 @overload
-def effect_vol(simple_returns: "ReturnSeries", period: period = ...) -> np.float64:
+def effect_vol(simple_returns: "ReturnSeries", period: period = ...) -> np.floating:
+    ...
+
+
+@overload
+def effect_vol(
+    simple_returns: np.ndarray, period: period = ...
+) -> Union[np.floating, np.ndarray]:
     ...
 
 
@@ -148,9 +174,14 @@ def effect_vol(
     -------
     effective_annual_volatility : qp.ReturnSeries or qp.ReturnDataFrame
     """
-    ann_factor = annualization_factor[period]
+    sqrt_ann_factor = _sqrt_annualization_factor[period]
+
+    values = _utils.dense_values(simple_returns, min_count=2)
+    if values is None:
+        return simple_returns.std() * sqrt_ann_factor
 
-    return simple_returns.std() * np.sqrt(ann_factor)
+    # Scale the column volatilities before wrapping them, so only one object is built
+    return _utils.wrap_reduction(simple_returns, _utils.std(values) * sqrt_ann_factor)
 
 
 @overload
@@ -159,7 +190,12 @@ def total_return(simple_returns: "ReturnDataFrame") -> "ReturnSeries":
 
 
 @overload
-def total_return(simple_returns: "ReturnSeries") -> np.float64:
+def total_return(simple_returns: "ReturnSeries") -> np.floating:
+    ...
+
+
+@overload
+def total_return(simple_returns: np.ndarray) -> Union[np.floating, np.ndarray]:
     ...
 
 
@@ -169,11 +205,19 @@ def total_return(simple_returns):
 
     Parameters
     ----------
-    returns : pd.DataFrame or pd.Series
+    returns : pd.DataFrame, pd.Series or np.ndarray
        Noncumulative simple returns of one or more timeseries.
 
     Returns
     -------
     total_returns : pd.Series or PythonScalar
     """
-    return (simple_returns + 1).prod() - 1
+    values = _utils.values_of(simple_returns, dtype="float64") + 1
+
+    # Missing values are skipped by setting them to 1 in the buffer owned here, which
+    # avoids the extra masked copy np.nanprod makes on every call
+    missing = np.isnan(values)
+    if missing.any():
+        values[missing] = 1
+
+    return _utils.wrap_reduction(simple_returns, values.prod(axis=0) - 1)
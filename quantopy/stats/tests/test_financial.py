@@ -7,7 +7,7 @@ import quantopy as qp
 
 @pytest.fixture(autouse=True)
 def random():
-    np.random.seed(0)
+    qp.random.seed(0)
 
 
 class TestSimpleReturnsFromPrice:
@@ -35,6 +35,14 @@ class TestSimpleReturnsFromPrice:
             rtol=1e-1,
         )
 
+        # Missing prices propagate to the returns on both sides, as in pct_change
+        assert_allclose(
+            qp.stats.get_simple_returns_from_price(
+                qp.ReturnSeries([80, 85, np.nan, 90])
+            ),
+            [0.0625, np.nan, np.nan],
+        )
+
     def test_return_data_frame(self) -> None:
         assert_allclose(
             qp.stats.get_simple_returns_from_price(
@@ -48,6 +56,28 @@ class TestSimpleReturnsFromPrice:
 
         assert qp.stats.get_simple_returns_from_price(qp.ReturnDataFrame([])).empty
 
+    def test_ndarray(self) -> None:
+        simple_returns = qp.stats.get_simple_returns_from_price(np.array([80, 85, 90]))
+
+        assert type(simple_returns) is np.ndarray
+        assert_allclose(simple_returns, [0.0625, 0.058824], rtol=1e-4)
+
+        assert_allclose(
+            qp.stats.get_simple_returns_from_price(
+                np.array([[80, 10], [85, 20], [90, 30]])
+            ),
+            [[0.0625, 1.0], [0.058824, 0.5]],
+            rtol=1e-4,
+        )
+
+    def test_float32(self) -> None:
+        simple_returns = qp.stats.get_simple_returns_from_price(
+            qp.ReturnSeries([80, 85, np.nan, 90], dtype="float32")
+        )
+
+        assert simple_returns.dtype == np.float32
+        assert_allclose(simple_returns, [0.0625, np.nan, np.nan])
+
 
 class TestCumulated:
     def test_return_series(self) -> None:
@@ -76,6 +106,12 @@ class TestCumulated:
             rtol=1e-1,
         )
 
+        assert_allclose(
+            qp.stats.cumulated(qp.ReturnSeries([0.5, np.nan, 0.333333])),
+            [1.5, np.nan, 2.0],
+            rtol=1e-1,
+        )
+
     def test_return_data_frame(self) -> None:
         assert_allclose(
             qp.stats.cumulated(
@@ -141,6 +177,31 @@ class TestRatio:
         assert_allclose(rs_sharpe_ratio, expected, rtol=1e-1)
         assert type(rs_sharpe_ratio) is qp.ReturnSeries
 
+        nd_sharpe_ratio = qp.stats.sharpe(rdf.to_numpy(), riskfree_rate, periodicity)
+        assert_allclose(nd_sharpe_ratio, rs_sharpe_ratio, rtol=1e-10)
+        assert type(nd_sharpe_ratio) is np.ndarray
+
+    def test_rolling_sharpe_ratio(self) -> None:
+        rs = qp.random.generator.returns(0.01, 0.05, 100)
+        periodicity = qp.stats.period.MONTHLY
+        rs_sharpe_ratio = qp.stats.rolling_sharpe(rs, 0.05, 24, periodicity)
+        assert type(rs_sharpe_ratio) is qp.ReturnSeries
+
+        assert rs_sharpe_ratio.iloc[:23].isna().all()
+        for start in [0, 36, 76]:
+            assert_allclose(
+                rs_sharpe_ratio.iloc[start + 23],
+                qp.stats.sharpe(rs.iloc[start:][:24], 0.05, periodicity),
+                rtol=1e-8,
+            )
+
+        rdf = qp.random.generator.returns([0.01, 0.02], [0.05, 0.1], 100)
+        rdf_sharpe_ratio = qp.stats.rolling_sharpe(rdf, 0.05, 24)
+        assert type(rdf_sharpe_ratio) is qp.ReturnDataFrame
+        assert_allclose(
+            rdf_sharpe_ratio.iloc[-1], qp.stats.sharpe(rdf.iloc[-24:], 0.05), rtol=1e-8
+        )
+
 
 class TestDrawdown:
     def test_return_series(self) -> None:
@@ -166,3 +227,44 @@ class TestDrawdown:
         expected = (wealth_index - previous_peaks) / previous_peaks
 
         assert_allclose(rs_drawdown, expected, rtol=1e-2)
+
+    def test_ndarray(self) -> None:
+        rs = qp.random.generator.returns([0.01, 0.02], [0.1, 0.05], 100)
+        rs_drawdown = qp.stats.drawdown(rs.to_numpy())
+        assert type(rs_drawdown) is np.ndarray
+
+        assert_allclose(rs_drawdown, qp.stats.drawdown(rs), rtol=1e-10)
+
+    def test_max_drawdown(self) -> None:
+        rs = qp.random.generator.returns(0.01, 0.1, 100)
+        rs_max_drawdown = qp.stats.max_drawdown(rs)
+        assert type(rs_max_drawdown) is np.float64
+        assert rs_max_drawdown == rs.drawdown().min()
+        assert rs.max_drawdown() == rs_max_drawdown
+
+        rdf = qp.random.generator.returns([0.01, 0.02], [0.1, 0.05], 100)
+        rdf.iloc[10, 0] = np.nan
+        rdf_max_drawdown = rdf.max_drawdown()
+        assert type(rdf_max_drawdown) is qp.ReturnSeries
+        assert_allclose(rdf_max_drawdown, rdf.drawdown().min())
+
+        assert qp.stats.max_drawdown(np.array([0.1, -0.5, 0.2])) == -0.5
+
+    def test_rolling_drawdown(self) -> None:
+        rs = qp.random.generator.returns(0.01, 0.1, 100)
+        rs_rolling_drawdown = qp.stats.rolling_drawdown(rs, 24)
+        assert type(rs_rolling_drawdown) is qp.ReturnSeries
+
+        expected = rs.rolling(24).apply(qp.stats.max_drawdown, raw=True)
+        assert_allclose(rs_rolling_drawdown, expected, rtol=1e-12)
+
+        rdf = qp.random.generator.returns([0.01, 0.02], [0.1, 0.05], 100)
+        rdf.iloc[50, 0] = np.nan
+        rdf_rolling_drawdown = qp.stats.rolling_drawdown(rdf, 12)
+        assert type(rdf_rolling_drawdown) is qp.ReturnDataFrame
+
+        # Windows with a missing value are NaN, as in pandas' rolling
+        expected = rdf.rolling(12).apply(qp.stats.max_drawdown, raw=True)
+        assert_allclose(rdf_rolling_drawdown, expected, rtol=1e-12)
+
+        assert qp.stats.rolling_drawdown(rs, 200).isna().all()
@@ -38,6 +38,17 @@ class TestGeoMean:
         assert_allclose(rs_gmean, -0.200802, rtol=1e-5)
         assert type(rs_gmean) is np.float64
 
+    def test_ndarray(self) -> None:
+        rs_gmean = qp.stats.gmean(np.array([0.9, 0.1, 0.2, 0.3, -0.9]))
+        assert_allclose(rs_gmean, -0.200802, rtol=1e-5)
+        assert type(rs_gmean) is np.float64
+
+        rdf_gmean = qp.stats.gmean(
+            np.array([[0.9, 0.05], [0.1, 0.1], [0.2, 0.2], [0.3, -0.5], [-0.9, 0.2]])
+        )
+        assert_allclose(rdf_gmean, [-0.200802, -0.036209], rtol=1e-5)
+        assert type(rdf_gmean) is np.ndarray
+
 
 class TestAnnualized:
     def test_return_dataframe(self):
@@ -206,6 +217,24 @@ class TestEffectVol:
             rtol=1e-1,
         )
 
+        # 3. Empty series, computed by pandas
+        effect = qp.stats.effect_vol(qp.ReturnSeries([], dtype="float64"))
+        assert type(effect) is np.float64
+        assert np.isnan(effect)
+
+    def test_float32(self):
+        rdf = qp.random.generator.returns([0.01, 0.01], [0.02397, 0.079601], 1000)
+
+        effect = qp.stats.effect_vol(rdf.astype("float32"), qp.stats.period.MONTHLY)
+        assert type(effect) is qp.ReturnSeries
+        assert effect.dtype == np.float32
+
+        assert_allclose(
+            effect,
+            qp.stats.effect_vol(rdf, qp.stats.period.MONTHLY),
+            rtol=1e-5,
+        )
+
 
 class TestTotalReturn:
     def test_return_series(self):
@@ -245,3 +274,17 @@ class TestTotalReturn:
         expected = qp.ReturnSeries([hpr_1, hpr_2], index=["stock_1", "stock_2"])
 
         tm.assert_almost_equal(rdf_total_return, expected, rtol=1e-4)
+
+    def test_ndarray(self):
+        total_return = qp.stats.total_return(np.array([[0.5, 0.1], [0.333333, -0.1]]))
+        assert type(total_return) is np.ndarray
+
+        assert_allclose(total_return, [1.0, -0.01], rtol=1e-5)
+
+    def test_missing_values(self):
+        rs = qp.ReturnSeries([0.5, np.nan, 0.333333])
+
+        rs_total_return = qp.stats.total_return(rs)
+        assert type(rs_total_return) is np.float64
+
+        assert_allclose(rs_total_return, 1.0, rtol=1e-5)
@@ -2,10 +2,16 @@ import numpy as np
 from numpy.testing import assert_allclose
 import pandas as pd
 import pandas._testing as tm
+import pytest
 
 import quantopy as qp
 
 
+@pytest.fixture(autouse=True)
+def random():
+    qp.random.seed(0)
+
+
 class TestReturnDataFrame:
     def test_from_price(self):
         rdf = qp.ReturnDataFrame.from_price([80, 85, 90])
@@ -73,6 +79,12 @@ class TestReturnDataFrame:
             rtol=1e-1,
         )
 
+        # float32 values keep their dtype, but are summed in float64
+        rdf = qp.ReturnDataFrame(np.full((100000, 2), 0.1), dtype="float32")
+        arithmetic_mean = rdf.mean()
+        assert arithmetic_mean.dtype == np.float32
+        assert_allclose(arithmetic_mean, [0.1, 0.1], rtol=1e-7)
+
     def test_gmean(self):
         rs = qp.ReturnDataFrame(
             {"x": [0.9, 0.1, 0.2, 0.3, -0.9], "y": [0.05, 0.1, 0.2, -0.5, 0.2]}
@@ -81,6 +93,62 @@ class TestReturnDataFrame:
         tm.assert_series_equal(rs.gmean(), expected, rtol=1e-5)
         assert type(rs.gmean()) is qp.ReturnSeries
 
+    def test_log(self):
+        rdf = qp.ReturnDataFrame(
+            {"stock_1": [0.062500, 0.058824], "stock_2": [0.500000, -0.333333]}
+        )
+        log_rdf = rdf.log()
+        assert type(log_rdf) is qp.ReturnDataFrame
+
+        assert_allclose(
+            log_rdf,
+            [[0.060625, 0.405465], [0.057158, -0.405465]],
+            rtol=1e-4,
+        )
+
+    def test_skew(self):
+        rdf = qp.ReturnDataFrame(
+            {"x": [0.9, 0.1, 0.2, 0.3, -0.9], "y": [0.05, 0.1, 0.2, -0.5, 0.2]}
+        )
+        rdf_skew = rdf.skew()
+        assert type(rdf_skew) is qp.ReturnSeries
+
+        assert_allclose(rdf_skew, [-0.591690, -1.320817], rtol=1e-5)
+
+    def test_kurtosis(self):
+        rdf = qp.ReturnDataFrame(
+            {"x": [0.9, 0.1, 0.2, 0.3, -0.9], "y": [0.05, 0.1, 0.2, -0.5, 0.2]}
+        )
+        rdf_kurtosis = rdf.kurtosis()
+        assert type(rdf_kurtosis) is qp.ReturnSeries
+
+        assert_allclose(rdf_kurtosis, [2.550892, 3.006335], rtol=1e-5)
+
+    def test_constant_returns(self):
+        rdf = qp.ReturnDataFrame({"x": [0.1, 0.1, 0.1], "y": [0.1, 0.2, 0.4]})
+
+        assert_allclose(rdf.skew(), [np.nan, 0.381802], rtol=1e-5)
+        assert_allclose(rdf.kurtosis(), [np.nan, 1.5], rtol=1e-5)
+        tm.assert_series_equal(
+            rdf.is_normal(), qp.ReturnSeries([False, True], index=["x", "y"])
+        )
+
+    def test_is_normal(self):
+        np.random.seed(0)
+        rdf = qp.ReturnDataFrame(
+            {
+                "normal": np.random.normal(0.01, 0.1, 1000),
+                "fat_tails": np.random.standard_t(2, 1000),
+            }
+        )
+        rdf_is_normal = rdf.is_normal()
+        assert type(rdf_is_normal) is qp.ReturnSeries
+
+        tm.assert_series_equal(
+            rdf_is_normal,
+            qp.ReturnSeries([True, False], index=["normal", "fat_tails"]),
+        )
+
     def test_manipulations(self):
         rdf = qp.ReturnDataFrame({"A": [1, 2, 3], "B": [4, 5, 6], "C": [7, 8, 9]})
         assert type(rdf) is qp.ReturnDataFrame
@@ -8,6 +8,7 @@ import quantopy as qp
 
 @pytest.fixture(autouse=True)
 def random():
+    qp.random.seed(0)
     np.random.seed(0)
 
 
@@ -86,11 +87,52 @@ class TestReturnSeries:
             rtol=1e-1,
         )
 
+        # float32 values reduce to a np.float32, as for ReturnDataFrame
+        arithmetic_mean = qp.ReturnSeries([0.1, 0.2], dtype="float32").mean()
+        assert type(arithmetic_mean) is np.float32
+        assert arithmetic_mean == np.float32(0.15)
+
     def test_gmean(self):
         rs = qp.ReturnSeries([0.9, 0.1, 0.2, 0.3, -0.9])
         assert_allclose(rs.gmean(), -0.200802, rtol=1e-5)
         assert type(rs.gmean()) is np.float64
 
+    def test_log(self):
+        log_rs = qp.ReturnSeries([0.062500, 0.500000, -0.333333]).log()
+        assert type(log_rs) is qp.ReturnSeries
+
+        assert_allclose(
+            log_rs,
+            [0.060625, 0.405465, -0.405465],
+            rtol=1e-4,
+        )
+
+    def test_skew(self):
+        rs_skew = qp.ReturnSeries([0.9, 0.1, 0.2, 0.3, -0.9]).skew()
+        assert type(rs_skew) is np.float64
+
+        assert_allclose(rs_skew, -0.591690, rtol=1e-5)
+
+    def test_kurtosis(self):
+        rs_kurtosis = qp.ReturnSeries([0.9, 0.1, 0.2, 0.3, -0.9]).kurtosis()
+        assert type(rs_kurtosis) is np.float64
+
+        assert_allclose(rs_kurtosis, 2.550892, rtol=1e-5)
+
+    def test_is_normal(self):
+        rs_is_normal = qp.ReturnSeries(np.random.normal(0.01, 0.1, 1000)).is_normal()
+        assert type(rs_is_normal) is np.bool_
+        assert rs_is_normal
+
+        assert not qp.ReturnSeries(np.random.standard_t(2, 1000)).is_normal()
+
+    def test_constant_returns(self):
+        rs = qp.ReturnSeries([0.1, 0.1, 0.1])
+
+        assert np.isnan(rs.skew())
+        assert np.isnan(rs.kurtosis())
+        assert not rs.is_normal()
+
     def test_manipulations(self):
         rs = qp.ReturnSeries([1, 2, 3])
         assert type(rs) is qp.ReturnSeries